@@ -1,17 +1,30 @@
 # app.py - FastAPI Backend
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
-import psycopg2
-from psycopg2.extras import RealDictCursor
-import csv
-import requests
-import zipfile
-from typing import List, Optional, Dict, Any
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+import io
+import asyncio
+import httpx
+from stream_unzip import stream_unzip
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from typing import List, Optional
 import os
 from pydantic import BaseModel
 import logging
-import codecs
+import hashlib
+import queue
+import orjson
+from aiocache import Cache
+from aiocache.serializers import NullSerializer
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 import threading
 import time
@@ -20,7 +33,13 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="UK Companies API")
+# orjson serializes responses in native code, well ahead of the stdlib
+# json encoder on JSON-heavy endpoints like /search
+app = FastAPI(title="UK Companies API", default_response_class=ORJSONResponse)
+
+# Compress large JSON payloads (a 100-row search page is 30-80 KiB) when
+# the client advertises Accept-Encoding; level 5 keeps CPU cost modest
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # CORS middleware
 app.add_middleware(
@@ -38,7 +57,43 @@ DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASS = os.getenv("DB_PASS", "postgres")
 DB_PORT = os.getenv("DB_PORT", "5432")
 
-# Global status tracker for download task
+DB_CONNINFO = (
+    f"host={DB_HOST} dbname={DB_NAME} user={DB_USER} "
+    f"password={DB_PASS} port={DB_PORT}"
+)
+
+# Search response cache: serialized response bytes keyed on the request
+# parameters, with a small in-process LRU tier in front of the shared
+# (Redis-backed, when configured) tier
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "60"))
+_LOCAL_CACHE_SIZE = 256
+_local_cache = OrderedDict()
+
+
+def _local_cache_get(key):
+    """Return cached response bytes from the in-process tier, or None"""
+    entry = _local_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, payload = entry
+    if expires_at < time.monotonic():
+        _local_cache.pop(key, None)
+        return None
+    _local_cache.move_to_end(key)
+    return payload
+
+
+def _local_cache_set(key, payload):
+    """Store response bytes in the in-process tier, evicting oldest first"""
+    _local_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, payload)
+    _local_cache.move_to_end(key)
+    while len(_local_cache) > _LOCAL_CACHE_SIZE:
+        _local_cache.popitem(last=False)
+
+
+# Global status tracker for download task, shared between the ingest
+# thread and the event loop; the lock keeps multi-field updates (e.g.
+# processed_records + status) consistent for /download/status readers
 download_status = {
     "is_running": False,
     "start_time": None,
@@ -48,37 +103,23 @@ download_status = {
     "total_records": 0,
     "processed_records": 0
 }
+_download_status_lock = threading.Lock()
+
+
+def update_download_status(**fields):
+    """Apply a consistent, locked update to the shared download status"""
+    with _download_status_lock:
+        download_status.update(fields)
+
+
+# Request/response models; the hot read paths return DB-rendered JSON
+# directly, so only the endpoints where validation earns its keep keep
+# Pydantic models
+class BatchSearchRequest(BaseModel):
+    queries: List[str]
+    per_page: int = 10
 
 
-# Response models
-class Address(BaseModel):
-    care_of: Optional[str] = None
-    po_box: Optional[str] = None
-    address_line_1: Optional[str] = None
-    address_line_2: Optional[str] = None
-    town: Optional[str] = None
-    county: Optional[str] = None
-    country: Optional[str] = None
-    postcode: Optional[str] = None
-
-class Company(BaseModel):
-    company_number: str
-    company_name: str
-    registered_office_address: Optional[Address] = None
-    company_category: Optional[str] = None
-    company_status: Optional[str] = None
-    country_of_origin: Optional[str] = None
-    incorporation_date: Optional[str] = None
-    sic_codes: Optional[str] = None
-
-
-class SearchResponse(BaseModel):
-    companies: List[Company]
-    total: int
-    page: int
-    per_page: int
-    
-    
 class DownloadStatus(BaseModel):
     is_running: bool
     start_time: Optional[str] = None
@@ -92,13 +133,13 @@ class DownloadStatus(BaseModel):
 def get_db_connection():
     """Create a database connection"""
     try:
-        conn = psycopg2.connect(
+        conn = psycopg.connect(
             host=DB_HOST,
-            database=DB_NAME,
+            dbname=DB_NAME,
             user=DB_USER,
             password=DB_PASS,
             port=DB_PORT,
-            cursor_factory=RealDictCursor,
+            row_factory=dict_row,
         )
         return conn
     except Exception as e:
@@ -108,15 +149,54 @@ def get_db_connection():
         )
 
 
-def init_db():
-    """Initialize database tables if they don't exist"""
+@contextmanager
+def db_conn():
+    """Context-managed connection for the synchronous ingest/init paths.
+
+    Request handlers go through the async pool; these one-shot paths just
+    need a connection that is reliably closed on error.
+    """
     conn = get_db_connection()
-    cur = conn.cursor()
     try:
-        # Create companies table with address fields
-        cur.execute(
-            """
-        CREATE TABLE IF NOT EXISTS companies (
+        yield conn
+    finally:
+        conn.close()
+
+
+# Generated-column expressions, shared by CREATE TABLE and the
+# migration of legacy trigger-maintained schemas in init_db()
+ADDRESS_TEXT_EXPR = """array_to_string(ARRAY[
+                NULLIF(reg_address_care_of, ''),
+                NULLIF(reg_address_po_box, ''),
+                NULLIF(reg_address_line_1, ''),
+                NULLIF(reg_address_line_2, ''),
+                NULLIF(reg_address_town, ''),
+                NULLIF(reg_address_county, ''),
+                NULLIF(reg_address_country, ''),
+                NULLIF(reg_address_postcode, '')
+            ], ', ')"""
+
+SEARCH_VECTOR_EXPR = """to_tsvector('english',
+                COALESCE(company_name, '') || ' ' ||
+                COALESCE(company_number, '') || ' ' ||
+                COALESCE(reg_address_care_of, '') || ' ' ||
+                COALESCE(reg_address_po_box, '') || ' ' ||
+                COALESCE(reg_address_line_1, '') || ' ' ||
+                COALESCE(reg_address_line_2, '') || ' ' ||
+                COALESCE(reg_address_town, '') || ' ' ||
+                COALESCE(reg_address_county, '') || ' ' ||
+                COALESCE(reg_address_country, '') || ' ' ||
+                COALESCE(reg_address_postcode, '') || ' ' ||
+                COALESCE(company_category, '') || ' ' ||
+                COALESCE(company_status, '') || ' ' ||
+                COALESCE(country_of_origin, '') || ' ' ||
+                COALESCE(sic_codes, '')
+            )"""
+
+
+# Column DDL for the companies table, shared by init_db() and the side
+# table the streamed reload builds before swapping it in
+COMPANIES_COLUMNS_SQL = f"""
             id SERIAL PRIMARY KEY,
             company_number VARCHAR(10) UNIQUE,
             company_name TEXT,
@@ -133,58 +213,95 @@ def init_db():
             country_of_origin VARCHAR(50),
             incorporation_date DATE,
             sic_codes TEXT,
-            search_vector TSVECTOR
-        );
-        """
+            registered_office_address_text TEXT GENERATED ALWAYS AS (
+                {ADDRESS_TEXT_EXPR}
+            ) STORED,
+            search_vector TSVECTOR GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPR}) STORED
+"""
+
+
+def init_db():
+    """Initialize database tables if they don't exist"""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    try:
+        # Create companies table with address fields. search_vector is a
+        # stored generated column, so the executor computes it in C during
+        # INSERT/COPY instead of firing a PL/pgSQL trigger per row.
+        cur.execute(
+            f"CREATE TABLE IF NOT EXISTS companies ({COMPANIES_COLUMNS_SQL});"
         )
 
-        # Create GIN index for full-text search
+        # Migrate legacy schemas (e.g. a database initialized by an older
+        # init-db.sql) where search_vector was maintained by a trigger and
+        # the address snippet column does not exist: the CREATE above is a
+        # no-op for them, and merely dropping the trigger would leave
+        # search_vector permanently NULL while COMPANY_JSON_SQL errors on
+        # the missing column
         cur.execute(
             """
-        CREATE INDEX IF NOT EXISTS idx_companies_search_vector ON companies USING GIN(search_vector);
-        """
+            SELECT
+                bool_or(column_name = 'registered_office_address_text')
+                    AS has_address_text,
+                bool_or(column_name = 'search_vector' AND is_generated = 'ALWAYS')
+                    AS vector_generated
+            FROM information_schema.columns
+            WHERE table_name = 'companies'
+            """
+        )
+        schema = cur.fetchone()
+        if not schema["has_address_text"]:
+            cur.execute(
+                f"""
+                ALTER TABLE companies ADD COLUMN registered_office_address_text
+                    TEXT GENERATED ALWAYS AS ({ADDRESS_TEXT_EXPR}) STORED;
+                """
+            )
+        if not schema["vector_generated"]:
+            cur.execute(
+                "DROP TRIGGER IF EXISTS companies_search_vector_update_trigger ON companies;"
+            )
+            cur.execute("DROP FUNCTION IF EXISTS companies_search_vector_update();")
+            cur.execute("DROP INDEX IF EXISTS idx_companies_search_vector;")
+            cur.execute("ALTER TABLE companies DROP COLUMN IF EXISTS search_vector;")
+            cur.execute(
+                f"""
+                ALTER TABLE companies ADD COLUMN search_vector
+                    TSVECTOR GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPR}) STORED;
+                """
+            )
+
+        # Store the wide tsvector out of line and uncompressed: ts_rank
+        # detoasts it per ranked row, and skipping the decompression pass
+        # keeps that cheap while heap tuples of the scalar columns stay
+        # dense. company_number lookups use the btree the UNIQUE
+        # constraint already creates.
+        cur.execute(
+            "ALTER TABLE companies ALTER COLUMN search_vector SET STORAGE EXTERNAL;"
         )
 
-        # Create a trigger to update the search vector
+        # Create GIN index for full-text search; fastupdate off because
+        # the table only changes via the bulk reload path
         cur.execute(
             """
-        CREATE OR REPLACE FUNCTION companies_search_vector_update() RETURNS TRIGGER AS $$
-        BEGIN
-            NEW.search_vector = to_tsvector('english', 
-                COALESCE(NEW.company_name, '') || ' ' || 
-                COALESCE(NEW.company_number, '') || ' ' || 
-                COALESCE(NEW.reg_address_care_of, '') || ' ' ||
-                COALESCE(NEW.reg_address_po_box, '') || ' ' ||
-                COALESCE(NEW.reg_address_line_1, '') || ' ' ||
-                COALESCE(NEW.reg_address_line_2, '') || ' ' ||
-                COALESCE(NEW.reg_address_town, '') || ' ' ||
-                COALESCE(NEW.reg_address_county, '') || ' ' ||
-                COALESCE(NEW.reg_address_country, '') || ' ' ||
-                COALESCE(NEW.reg_address_postcode, '') || ' ' ||
-                COALESCE(NEW.company_category, '') || ' ' || 
-                COALESCE(NEW.company_status, '') || ' ' || 
-                COALESCE(NEW.country_of_origin, '') || ' ' || 
-                COALESCE(NEW.sic_codes, '')
-            );
-            RETURN NEW;
-        END
-        $$ LANGUAGE plpgsql;
+        CREATE INDEX IF NOT EXISTS idx_companies_search_vector ON companies USING GIN(search_vector) WITH (fastupdate = off);
         """
         )
 
-        # Drop the trigger if it exists
+        # Status index so searches scoped to e.g. active companies can
+        # bitmap-AND away the dissolved majority
         cur.execute(
             """
-        DROP TRIGGER IF EXISTS companies_search_vector_update_trigger ON companies;
+        CREATE INDEX IF NOT EXISTS idx_companies_status ON companies (company_status);
         """
         )
 
-        # Create the trigger
+        # Trigram index for short/prefix queries that tokenize to an empty
+        # tsquery and would otherwise miss the full-text index entirely
+        cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
         cur.execute(
             """
-        CREATE TRIGGER companies_search_vector_update_trigger
-        BEFORE INSERT OR UPDATE ON companies
-        FOR EACH ROW EXECUTE FUNCTION companies_search_vector_update();
+        CREATE INDEX IF NOT EXISTS idx_companies_name_trgm ON companies USING GIN (company_name gin_trgm_ops) WITH (fastupdate = off);
         """
         )
 
@@ -207,6 +324,51 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Startup error: {e}")
 
+    # Shared async connection pool: request handlers reuse warm connections
+    # instead of paying TCP + auth setup per request, and DB waits no longer
+    # block the event loop
+    # prepare_threshold=0 prepares every statement on first use, so the
+    # search SQL is parsed and planned once per connection rather than on
+    # every execution
+    app.state.pool = AsyncConnectionPool(
+        DB_CONNINFO,
+        min_size=4,
+        max_size=32,
+        kwargs={"row_factory": dict_row, "prepare_threshold": 0},
+        open=False,
+    )
+    await app.state.pool.open()
+
+    # Shared search-cache tier: Redis when configured, so workers share
+    # hits; plain in-memory otherwise
+    # Cached values are pre-serialized response bytes, so the cache must
+    # store them as-is: the Redis backend's default JsonSerializer would
+    # raise TypeError on bytes. The memory backend defaults to
+    # NullSerializer already; pass it explicitly for both.
+    if os.getenv("REDIS_HOST"):
+        app.state.search_cache = Cache(
+            Cache.REDIS,
+            endpoint=os.getenv("REDIS_HOST"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            namespace="search",
+            serializer=NullSerializer(),
+        )
+    else:
+        app.state.search_cache = Cache(
+            Cache.MEMORY, namespace="search", serializer=NullSerializer()
+        )
+
+    # Singleton handle for the ingest task; the lock makes the
+    # check-then-start in /download atomic on the event loop
+    app.state.download_lock = asyncio.Lock()
+    app.state.download_task = None
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Run on application shutdown"""
+    await app.state.pool.close()
+
 
 @app.get("/")
 async def root():
@@ -214,172 +376,381 @@ async def root():
     return {"message": "UK Companies House API"}
 
 
-def process_companies_data_in_background():
-    """Function to handle the download and import process in the background"""
-    global download_status
-    
+class _IterStream(io.RawIOBase):
+    """Read-only file object over an iterator of byte chunks.
+
+    Adapts the stream-unzip generators to the file interface the Arrow
+    CSV reader expects, without concatenating the stream in memory.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = bytes(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def ingest_companies_stream(zipped_chunks):
+    """Decompress and bulk-load the dump as the download streams in.
+
+    Runs in a worker thread fed raw zip bytes by the async download task
+    through a bounded queue, so nothing is staged on disk: peak local
+    storage is a handful of in-flight chunks rather than the full
+    multi-GB zip plus an extracted CSV.
+    """
+    first_entry = True
+    for file_name, file_size, unzipped_chunks in stream_unzip(
+        iter(zipped_chunks.get, None)
+    ):
+        if first_entry:  # Assuming there's only one file
+            _load_csv_stream(_IterStream(unzipped_chunks))
+            first_entry = False
+        # stream-unzip requires each entry to be drained before advancing
+        for _ in unzipped_chunks:
+            pass
+
+
+def _load_csv_stream(csv_file):
+    """Parse the decompressed CSV stream and COPY it into Postgres"""
+    with db_conn() as conn, conn.cursor() as cur:
+        # Load into a fresh side table and swap it in at commit: readers
+        # keep querying the live companies table for the whole streamed
+        # download, and the ACCESS EXCLUSIVE lock is only taken for the
+        # final drop/rename instead of being held by a TRUNCATE for
+        # hours. UNLOGGED skips WAL for the transient load; safe because
+        # the source is re-downloadable, and the table is switched to
+        # LOGGED before the swap. Indexes are built after the data lands,
+        # which is far cheaper than N incremental inserts.
+        cur.execute("DROP TABLE IF EXISTS companies_load;")
+        cur.execute(
+            f"CREATE UNLOGGED TABLE companies_load ({COMPANIES_COLUMNS_SQL});"
+        )
+        # Same tsvector storage tuning as the live table (see init_db)
+        cur.execute(
+            "ALTER TABLE companies_load ALTER COLUMN search_vector SET STORAGE EXTERNAL;"
+        )
+
+        # Map required columns including full address fields
+        required_columns = {
+            " CompanyNumber": "company_number",
+            "CompanyName": "company_name",
+            "RegAddress.CareOf": "reg_address_care_of",
+            "RegAddress.POBox": "reg_address_po_box",
+            "RegAddress.AddressLine1": "reg_address_line_1",
+            "RegAddress.AddressLine2": "reg_address_line_2",
+            "RegAddress.PostTown": "reg_address_town",
+            "RegAddress.County": "reg_address_county",
+            "RegAddress.Country": "reg_address_country",
+            "RegAddress.PostCode": "reg_address_postcode",
+            "CompanyCategory": "company_category",
+            "CompanyStatus": "company_status",
+            "CountryOfOrigin": "country_of_origin",
+            "IncorporationDate": "incorporation_date",
+            "SICCode.SicText_1": "sic_codes",
+        }
+
+        # Parse the CSV with Arrow's multithreaded C++ reader
+        # instead of a per-row Python loop; empty strings become
+        # NULLs. IncorporationDate stays a string column here and is
+        # converted per batch with pc.strptime(error_is_null=True),
+        # which NULLs malformed dates instead of aborting the whole
+        # load the way the reader's strict date conversion would.
+        reader = pacsv.open_csv(
+            csv_file,
+            read_options=pacsv.ReadOptions(block_size=64 << 20),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=list(required_columns.keys()),
+                column_types={
+                    csv_col: pa.string() for csv_col in required_columns
+                },
+                strings_can_be_null=True,
+            ),
+        )
+        records_processed = 0
+
+        # Hoist loop invariants: column order and the date
+        # column's position don't change per batch
+        csv_cols = tuple(required_columns)
+        date_idx = csv_cols.index("IncorporationDate")
+
+        # Producer thread keeps the Arrow reader decompressing
+        # and parsing the next batches while the main thread
+        # feeds COPY, overlapping parse CPU with DB ingest I/O;
+        # the bounded queue caps buffered batches
+        batches = queue.Queue(maxsize=4)
+
+        def read_batches():
+            try:
+                for batch in reader:
+                    batches.put(batch)
+            finally:
+                batches.put(None)  # End-of-stream marker
+
+        reader_thread = threading.Thread(target=read_batches, daemon=True)
+        reader_thread.start()
+
+        # Binary COPY packs each field directly into the libpq
+        # stream, skipping the text escape/parse round-trip of
+        # CSV COPY and the temporary corrected file on disk
+        with cur.copy(
+            "COPY companies_load ({}) FROM STDIN (FORMAT BINARY)".format(
+                ", ".join(required_columns.values())
+            )
+        ) as copy:
+            copy.set_types(COPY_TYPES)
+
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                columns = [
+                    batch.column(csv_col).to_pylist()
+                    for csv_col in csv_cols
+                ]
+                # Vectorized DD/MM/YYYY parse in Arrow C++; malformed
+                # values become NULL instead of aborting the load
+                columns[date_idx] = pc.cast(
+                    pc.strptime(
+                        batch.column("IncorporationDate"),
+                        format="%d/%m/%Y",
+                        unit="s",
+                        error_is_null=True,
+                    ),
+                    pa.date32(),
+                ).to_pylist()
+                for values in zip(*columns):
+                    copy.write_row(values)
+
+                # Update progress per record batch; the total row count
+                # is unknown while streaming, so percentage tracking
+                # stays with the byte counter on the download side
+                records_processed += batch.num_rows
+                update_download_status(processed_records=records_processed)
+
+        reader_thread.join()
+
+        # Rebuild the search indexes in one pass over the loaded
+        # data, spreading the sort/build across parallel maintenance
+        # workers. The tsvectors themselves are computed natively by
+        # the generated column during COPY; precomputing them
+        # client-side would have to reproduce the 'english'
+        # dictionary output exactly, so the parallelism lives in the
+        # index builds instead.
+        # SET cannot take bind parameters (psycopg3 uses server-side
+        # binding), so interpolate the worker count as a validated int
+        cur.execute(
+            "SET max_parallel_maintenance_workers = {};".format(
+                int(os.cpu_count() or 2)
+            )
+        )
+        cur.execute("SET maintenance_work_mem = '2GB';")
+        # fastupdate=off keeps entries out of the GIN pending list; the
+        # table only changes via this bulk reload, so the incremental
+        # insert speed the pending list buys is never needed. The indexes
+        # carry _load names until the swap because the live table still
+        # owns the canonical ones.
+        cur.execute(
+            "CREATE INDEX idx_companies_search_vector_load ON companies_load USING GIN(search_vector) WITH (fastupdate = off);"
+        )
+        cur.execute(
+            "CREATE INDEX idx_companies_name_trgm_load ON companies_load USING GIN (company_name gin_trgm_ops) WITH (fastupdate = off);"
+        )
+        cur.execute(
+            "CREATE INDEX idx_companies_status_load ON companies_load (company_status);"
+        )
+
+        # Restore crash safety now the data is loaded
+        cur.execute("ALTER TABLE companies_load SET LOGGED;")
+
+        # Swap the side table in; this is the only moment the read path
+        # waits, and cached plans re-resolve the name on next execution.
+        # The renames keep index/constraint/sequence names identical to
+        # what init_db creates so the next reload finds them.
+        cur.execute("DROP TABLE companies;")
+        cur.execute("ALTER TABLE companies_load RENAME TO companies;")
+        cur.execute(
+            "ALTER INDEX idx_companies_search_vector_load RENAME TO idx_companies_search_vector;"
+        )
+        cur.execute(
+            "ALTER INDEX idx_companies_name_trgm_load RENAME TO idx_companies_name_trgm;"
+        )
+        cur.execute(
+            "ALTER INDEX idx_companies_status_load RENAME TO idx_companies_status;"
+        )
+        cur.execute("ALTER INDEX companies_load_pkey RENAME TO companies_pkey;")
+        cur.execute(
+            "ALTER INDEX companies_load_company_number_key RENAME TO companies_company_number_key;"
+        )
+        cur.execute("ALTER SEQUENCE companies_load_id_seq RENAME TO companies_id_seq;")
+
+        conn.commit()
+
+    logger.info("Data successfully loaded into the database")
+
+
+async def process_companies_data_in_background():
+    """Handle the download and import process in the background"""
     try:
         # Mark as running and reset status
-        download_status = {
-            "is_running": True,
-            "start_time": datetime.now().isoformat(),
-            "completion_percentage": 0,
-            "status": "downloading",
-            "error": None,
-            "total_records": 0,
-            "processed_records": 0
-        }
-        
+        update_download_status(
+            is_running=True,
+            start_time=datetime.now().isoformat(),
+            completion_percentage=0,
+            status="downloading",
+            error=None,
+            total_records=0,
+            processed_records=0,
+        )
+
         # Companies House data URL
         url = "https://download.companieshouse.gov.uk/BasicCompanyDataAsOneFile-2024-04-01.zip"
 
         logger.info(f"Downloading data from {url}")
-        response = requests.get(url, stream=True)
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to download data, status code: {response.status_code}")
-
-        # Create temporary file to store the zip
-        with open("companies_data.zip", "wb") as f:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size > 0:
-                    # Update download progress
-                    download_status["completion_percentage"] = min(50, int(downloaded * 50 / total_size))
-                    
-        logger.info("Download complete, extracting data")
-        download_status["status"] = "processing"
-        
-        # Extract the CSV from the zip
-        with zipfile.ZipFile("companies_data.zip", "r") as zip_ref:
-            csv_filename = zip_ref.namelist()[0]  # Assuming there's only one file
-            with zip_ref.open(csv_filename) as csv_file:
-                # Count total records for progress tracking
-                line_count = sum(1 for _ in codecs.iterdecode(csv_file, "utf-8"))
-                download_status["total_records"] = line_count - 1  # Subtract header row
-                
-            # Reopen the file for processing
-            with zip_ref.open(csv_filename) as csv_file:
-                # Map required columns including full address fields
-                required_columns = {
-                    " CompanyNumber": "company_number",
-                    "CompanyName": "company_name",
-                    "RegAddress.CareOf": "reg_address_care_of",
-                    "RegAddress.POBox": "reg_address_po_box",
-                    "RegAddress.AddressLine1": "reg_address_line_1",
-                    "RegAddress.AddressLine2": "reg_address_line_2",
-                    "RegAddress.PostTown": "reg_address_town",
-                    "RegAddress.County": "reg_address_county",
-                    "RegAddress.Country": "reg_address_country",
-                    "RegAddress.PostCode": "reg_address_postcode",
-                    "CompanyCategory": "company_category",
-                    "CompanyStatus": "company_status",
-                    "CountryOfOrigin": "country_of_origin",
-                    "IncorporationDate": "incorporation_date",
-                    "SICCode.SicText_1": "sic_codes",
-                }
-
-                with open(
-                    "temp_companies_corrected.csv", "w", encoding="utf-8"
-                ) as corrected_csv:
-                    writer = csv.DictWriter(
-                        corrected_csv, fieldnames=required_columns.values()
-                    )
-                    writer.writeheader()
-
-                    reader = csv.DictReader(codecs.iterdecode(csv_file, "utf-8"))
-                    records_processed = 0
-                    
-                    for row in reader:
-                        # Map and transform the required columns
-                        mapped_row = {}
-                        for csv_col, db_col in required_columns.items():
-                            value = row.get(csv_col, None)
-                            if csv_col == "IncorporationDate" and value:
-                                try:
-                                    # Convert from DD/MM/YYYY to YYYY-MM-DD
-                                    value = datetime.strptime(
-                                        value, "%d/%m/%Y"
-                                    ).strftime("%Y-%m-%d")
-                                except ValueError:
-                                    logger.warning(
-                                        f"Invalid date format for IncorporationDate: {value}"
-                                    )
-                                    value = None  # Set to NULL if invalid
-                            mapped_row[db_col] = value
-                        writer.writerow(mapped_row)
-                        
-                        # Update progress
-                        records_processed += 1
-                        if records_processed % 1000 == 0:  # Update every 1000 records
-                            download_status["processed_records"] = records_processed
-                            download_status["completion_percentage"] = 50 + int(records_processed * 50 / download_status["total_records"])
-
-        logger.info("Temporary corrected CSV file created, loading into database")
-
-        # Use PostgreSQL's COPY command to load the corrected data
-        conn = get_db_connection()
-        cur = conn.cursor()
-
-        # Clear existing data
-        cur.execute("TRUNCATE TABLE companies RESTART IDENTITY;")
-
-        # Load data using COPY
-        with open(
-            "temp_companies_corrected.csv", "r", encoding="utf-8"
-        ) as corrected_csv:
-            cur.copy_expert(
-                """
-                COPY companies (company_number, company_name, 
-                reg_address_care_of, reg_address_po_box, reg_address_line_1, reg_address_line_2,
-                reg_address_town, reg_address_county, reg_address_country, reg_address_postcode,
-                company_category, company_status, country_of_origin, incorporation_date, sic_codes)
-                FROM STDIN WITH CSV HEADER
-                """,
-                corrected_csv,
-            )
+        # The download feeds the ingest thread raw zip bytes through a
+        # bounded queue: unzip, CSV parse and COPY overlap the transfer,
+        # and the zip never touches disk. Progress is tracked by bytes
+        # consumed against Content-Length since the row total is unknown
+        # until the stream ends.
+        loop = asyncio.get_running_loop()
+        zipped_chunks = queue.Queue(maxsize=8)
+        ingest = loop.run_in_executor(None, ingest_companies_stream, zipped_chunks)
 
-        conn.commit()
-        logger.info("Data successfully loaded into the database")
+        def put_with_ingest_check(item):
+            """Blocking put that wakes periodically to notice a dead consumer.
+
+            If the ingest thread raises while the queue is full, an
+            untimed put would never return and wedge this task forever
+            (leaving /download reporting "already in progress"). Returns
+            False once the ingest future has finished.
+            """
+            while not ingest.done():
+                try:
+                    zipped_chunks.put(item, timeout=1.0)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        download_error = None
+        try:
+            timeout = httpx.Timeout(60.0, connect=5.0)
+            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+                async with client.stream("GET", url) as response:
+                    if response.status_code != 200:
+                        raise Exception(f"Failed to download data, status code: {response.status_code}")
+
+                    total_size = int(response.headers.get("content-length", 0))
+                    downloaded = 0
+                    last_pct = -1
+
+                    async for chunk in response.aiter_bytes(1 << 20):
+                        # put blocks while the ingest side is behind, so
+                        # it runs on the executor rather than stalling the
+                        # event loop
+                        if not await loop.run_in_executor(
+                            None, put_with_ingest_check, chunk
+                        ):
+                            # Ingest failed; stop feeding and surface its
+                            # exception when awaited below
+                            break
+                        downloaded += len(chunk)
+                        if total_size > 0:
+                            # Publish progress only when the integer percent
+                            # actually moves, not once per chunk
+                            pct = min(99, downloaded * 100 // total_size)
+                            if pct != last_pct:
+                                last_pct = pct
+                                update_download_status(completion_percentage=pct)
 
-        # Clean up temporary files
-        os.remove("companies_data.zip")
-        os.remove("temp_companies_corrected.csv")
+            logger.info("Download complete, finishing import")
+            update_download_status(status="processing")
+        except Exception as e:
+            download_error = e
+            raise
+        finally:
+            # Always deliver the end-of-stream sentinel, even when the
+            # download failed mid-stream: without it the ingest thread
+            # blocks in queue.get forever, pinning its connection and an
+            # open transaction (with the half-built side table) until
+            # restart.
+            if download_error is None:
+                # Clean download: the queue is routinely full here (the
+                # transfer is throttled by the bounded queue), and every
+                # buffered chunk is tail data the ingest still needs, so
+                # the sentinel must wait for a free slot and land after
+                # all of it
+                await loop.run_in_executor(None, put_with_ingest_check, None)
+            else:
+                # Failed download: the buffered tail of the stream is
+                # useless, so discard chunks to make room for the
+                # sentinel rather than blocking here as well
+                while not ingest.done():
+                    try:
+                        zipped_chunks.put_nowait(None)
+                        break
+                    except queue.Full:
+                        try:
+                            zipped_chunks.get_nowait()
+                        except queue.Empty:
+                            pass
+            try:
+                await ingest
+            except Exception:
+                if download_error is None:
+                    raise
+                # The download error is the root cause; the ingest side
+                # typically fails as a consequence of the cut stream
+                logger.exception("Ingest failed after download error")
 
         # Update final status
-        download_status["completion_percentage"] = 100
-        download_status["status"] = "completed"
-        download_status["processed_records"] = download_status["total_records"]
+        with _download_status_lock:
+            download_status["completion_percentage"] = 100
+            download_status["status"] = "completed"
+            download_status["total_records"] = download_status["processed_records"]
         logger.info("Download and import process completed successfully")
-        
+
     except Exception as e:
         logger.error(f"Error in background process: {e}")
-        download_status["status"] = "failed"
-        download_status["error"] = str(e)
+        update_download_status(status="failed", error=str(e))
     finally:
-        download_status["is_running"] = False
+        update_download_status(is_running=False)
 
 
 @app.post("/download")
-async def download_companies_data(background_tasks: BackgroundTasks):
+async def download_companies_data():
     """Start the download process in the background"""
-    global download_status
-    
-    # If already running, return current status
-    if download_status["is_running"]:
-        return {
-            "status": "running",
-            "message": "Download already in progress",
-            "current_status": download_status
-        }
-    
-    # Start background task
-    background_tasks.add_task(process_companies_data_in_background)
-    
+    # The lock closes the race where two concurrent POSTs both observe
+    # no running task and both start an ingest
+    async with app.state.download_lock:
+        task = app.state.download_task
+        if task is not None and not task.done():
+            with _download_status_lock:
+                snapshot = dict(download_status)
+            return {
+                "status": "running",
+                "message": "Download already in progress",
+                "current_status": snapshot
+            }
+
+        # Schedule the async download on the running event loop; unlike
+        # BackgroundTasks it starts immediately rather than after the
+        # response
+        app.state.download_task = asyncio.create_task(
+            process_companies_data_in_background()
+        )
+
     return {
         "status": "started",
         "message": "Download process started in the background"
@@ -389,173 +760,380 @@ async def download_companies_data(background_tasks: BackgroundTasks):
 @app.get("/download/status", response_model=DownloadStatus)
 async def get_download_status():
     """Get the current status of the download process"""
-    return download_status
+    # Snapshot under the lock so readers never see a half-applied update
+    with _download_status_lock:
+        return dict(download_status)
+
+
+# Column order used for the COPY-based ingest paths
+BATCH_COLUMNS = (
+    "company_number", "company_name",
+    "reg_address_care_of", "reg_address_po_box", "reg_address_line_1", "reg_address_line_2",
+    "reg_address_town", "reg_address_county", "reg_address_country", "reg_address_postcode",
+    "company_category", "company_status", "country_of_origin", "incorporation_date", "sic_codes",
+)
+
+# Postgres types for BATCH_COLUMNS, used by the binary COPY protocol
+COPY_TYPES = (
+    "varchar", "text",
+    "text", "text", "text", "text",
+    "text", "text", "text", "text",
+    "varchar", "varchar", "varchar", "date", "text",
+)
+
+
+def create_staging_table(cursor):
+    """Create the temporary staging table that batches are COPYed into"""
+    cursor.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS companies_stage (LIKE companies INCLUDING DEFAULTS) ON COMMIT DROP;"
+    )
 
 
 def insert_batch(cursor, batch):
-    """Insert a batch of company records"""
-    insert_query = """
-    INSERT INTO companies 
-    (company_number, company_name, 
-    reg_address_care_of, reg_address_po_box, reg_address_line_1, reg_address_line_2,
-    reg_address_town, reg_address_county, reg_address_country, reg_address_postcode,
-    company_category, company_status, country_of_origin, incorporation_date, sic_codes)
-    VALUES (%(company_number)s, %(company_name)s, 
-    %(reg_address_care_of)s, %(reg_address_po_box)s, %(reg_address_line_1)s, %(reg_address_line_2)s,
-    %(reg_address_town)s, %(reg_address_county)s, %(reg_address_country)s, %(reg_address_postcode)s,
-    %(company_category)s, %(company_status)s, %(country_of_origin)s, 
-    %(incorporation_date)s, %(sic_codes)s)
-    ON CONFLICT (company_number) DO UPDATE SET
-    company_name = EXCLUDED.company_name,
-    reg_address_care_of = EXCLUDED.reg_address_care_of,
-    reg_address_po_box = EXCLUDED.reg_address_po_box,
-    reg_address_line_1 = EXCLUDED.reg_address_line_1,
-    reg_address_line_2 = EXCLUDED.reg_address_line_2,
-    reg_address_town = EXCLUDED.reg_address_town,
-    reg_address_county = EXCLUDED.reg_address_county,
-    reg_address_country = EXCLUDED.reg_address_country,
-    reg_address_postcode = EXCLUDED.reg_address_postcode,
-    company_category = EXCLUDED.company_category,
-    company_status = EXCLUDED.company_status,
-    country_of_origin = EXCLUDED.country_of_origin,
-    incorporation_date = EXCLUDED.incorporation_date,
-    sic_codes = EXCLUDED.sic_codes
+    """Stream a batch of company rows into the staging table via COPY.
+
+    Rows are sequences ordered as BATCH_COLUMNS; positional tuples skip
+    the per-record dict construction and key hashing a mapping interface
+    would cost across a multi-million-row load. Binary COPY FROM STDIN
+    avoids the per-row Bind/Execute round-trip that made executemany the
+    bottleneck of the batch path, and skips CSV escaping entirely. Rows
+    land in companies_stage; call merge_staging_table once at the end of
+    the load to upsert them into companies in a single statement.
     """
-    cursor.executemany(insert_query, batch)
+    with cursor.copy(
+        "COPY companies_stage ({}) FROM STDIN (FORMAT BINARY)".format(
+            ", ".join(BATCH_COLUMNS)
+        )
+    ) as copy:
+        copy.set_types(COPY_TYPES)
+        for row in batch:
+            copy.write_row(row)
+
+
+def merge_staging_table(cursor):
+    """Upsert all staged rows into companies in one set-based statement"""
+    columns = ", ".join(BATCH_COLUMNS)
+    updates = ", ".join(
+        f"{col} = EXCLUDED.{col}" for col in BATCH_COLUMNS if col != "company_number"
+    )
+    cursor.execute(
+        f"""
+        INSERT INTO companies ({columns})
+        SELECT {columns} FROM companies_stage
+        ON CONFLICT (company_number) DO UPDATE SET {updates}
+        """
+    )
+
 
+# Response shaping pushed into Postgres: each row arrives as a finished
+# JSON document, so the hot path splices strings instead of building and
+# re-serializing per-row Python dicts
+COMPANY_JSON_SQL = """jsonb_build_object(
+        'company_number', company_number,
+        'company_name', company_name,
+        'registered_office_address', jsonb_build_object(
+            'care_of', reg_address_care_of,
+            'po_box', reg_address_po_box,
+            'address_line_1', reg_address_line_1,
+            'address_line_2', reg_address_line_2,
+            'town', reg_address_town,
+            'county', reg_address_county,
+            'country', reg_address_country,
+            'postcode', reg_address_postcode
+        ),
+        'address_snippet', registered_office_address_text,
+        'company_category', company_category,
+        'company_status', company_status,
+        'country_of_origin', country_of_origin,
+        'incorporation_date', incorporation_date,
+        'sic_codes', sic_codes
+    )::text"""
+
+
+def build_search_payload(rows, total, page, per_page, next_rank, next_number):
+    """Splice DB-rendered company JSON into the response envelope"""
+    tail = orjson.dumps(
+        {
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "next_rank": next_rank,
+            "next_number": next_number,
+        }
+    )
+    companies_json = ",".join(row["company"] for row in rows)
+    # tail[1:] drops the opening brace so the envelope closes around it
+    return b'{"companies":[' + companies_json.encode() + b"]," + tail[1:]
 
-@app.get("/search", response_model=SearchResponse)
+
+# No response_model: the payload is assembled from DB-side JSON and
+# orjson, skipping the Pydantic validation pass
+@app.get("/search")
 async def search_companies(
     query: str = Query(..., min_length=1, description="Search query"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Results per page"),
+    after_rank: Optional[float] = Query(
+        None, description="Keyset cursor: rank of the last row of the previous page"
+    ),
+    after_number: Optional[str] = Query(
+        None, description="Keyset cursor: company number of the last row of the previous page"
+    ),
+    status: Optional[str] = Query(
+        None, description="Restrict results to a company status, e.g. Active"
+    ),
 ):
     """Search companies by name, number, address or other fields"""
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
+        # Search terms are zipfian: identical requests re-run the same
+        # ranked query, so cache the serialized response bytes
+        cache_key = hashlib.sha1(
+            f"{query}|{page}|{per_page}|{after_rank}|{after_number}|{status}".encode()
+        ).hexdigest()
 
-        # Calculate offset
-        offset = (page - 1) * per_page
+        payload = _local_cache_get(cache_key)
+        if payload is None:
+            payload = await app.state.search_cache.get(cache_key)
+            if payload is not None:
+                _local_cache_set(cache_key, payload)
+        if payload is not None:
+            return Response(
+                content=payload,
+                media_type="application/json",
+                headers={"ETag": cache_key},
+            )
 
-        # Get total count
-        cur.execute(
-            "SELECT COUNT(*) as total FROM companies WHERE search_vector @@ plainto_tsquery('english', %s)",
-            (query,),
+        async with app.state.pool.connection() as conn:
+            # 1-2 char prefixes and partial company numbers tokenize to an
+            # empty tsquery; route those at the trigram/number indexes
+            # instead of probing the full-text index for nothing
+            cur = await conn.execute(
+                "SELECT plainto_tsquery('english', %s)::text = '' AS is_empty",
+                (query,),
+            )
+            tsquery_empty = (await cur.fetchone())["is_empty"]
+
+            # Optional status restriction shared by both query paths
+            status_clause = " AND company_status = %s" if status else ""
+            status_params = (status,) if status else ()
+
+            # Set when the total comes from planner statistics rather
+            # than an exact window count
+            approx_total = None
+
+            if tsquery_empty:
+                offset = (page - 1) * per_page
+                cur = await conn.execute(
+                    f"""
+                    SELECT {COMPANY_JSON_SQL} AS company,
+                        company_number,
+                        count(*) OVER () AS total
+                    FROM companies
+                    WHERE (company_name ILIKE %s || '%%' OR company_number = upper(%s))
+                    """
+                    + status_clause
+                    + """
+                    ORDER BY company_name, company_number
+                    LIMIT %s OFFSET %s
+                    """,
+                    (query, query) + status_params + (per_page, offset),
+                )
+                companies = await cur.fetchall()
+                next_rank = None
+                next_number = None
+            else:
+                # One query returns the page plus the total as a window
+                # aggregate, so the GIN probe and ranking run once instead
+                # of twice; the CTE computes the tsquery a single time.
+                # The hits CTE sorts and limits narrow (id, rank) rows, so
+                # the JSON document is only assembled for the page that is
+                # actually returned, not for every matching row fed to the
+                # top-N sort.
+                # The exact total (a window count over every match) is
+                # only paid for on the first page; continuations reuse
+                # the planner's row estimate below instead of rescanning
+                # the whole posting list per page
+                use_exact_total = after_rank is None and page == 1
+                total_col = (
+                    "count(*) OVER () AS total" if use_exact_total else "0 AS total"
+                )
+                hits_clause = f"""
+                    WITH q AS (SELECT plainto_tsquery('english', %s) AS tsq),
+                    hits AS (
+                        SELECT id, ts_rank(search_vector, q.tsq) AS rank,
+                            {total_col}
+                        FROM companies, q
+                        WHERE search_vector @@ q.tsq
+                """ + status_clause
+                outer_clause = f"""
+                    )
+                    SELECT {COMPANY_JSON_SQL} AS company,
+                        c.company_number, h.rank, h.total
+                    FROM hits h JOIN companies c ON c.id = h.id
+                    ORDER BY h.rank DESC, c.company_number DESC
+                """
+
+                if after_rank is not None and after_number is not None:
+                    # Keyset pagination: descend the (rank, company_number)
+                    # ordering from the cursor, so deep pages cost
+                    # O(per_page) instead of computing and discarding
+                    # OFFSET ranked rows
+                    cur = await conn.execute(
+                        hits_clause
+                        + """
+                        AND (ts_rank(search_vector, q.tsq), company_number) < (%s, %s)
+                        ORDER BY rank DESC, company_number DESC
+                        LIMIT %s
+                        """
+                        + outer_clause,
+                        (query,) + status_params + (after_rank, after_number, per_page),
+                    )
+                else:
+                    # OFFSET fallback for clients paginating by page number
+                    offset = (page - 1) * per_page
+                    cur = await conn.execute(
+                        hits_clause
+                        + """
+                        ORDER BY rank DESC, company_number DESC
+                        LIMIT %s OFFSET %s
+                        """
+                        + outer_clause,
+                        (query,) + status_params + (per_page, offset),
+                    )
+
+                companies = await cur.fetchall()
+
+                next_rank = None
+                next_number = None
+                if not companies and after_rank is None and page == 1:
+                    # Stemming can miss entirely (misspellings, hyphened
+                    # identifiers); retry the first page by trigram
+                    # similarity, served by the trgm GIN index
+                    await conn.execute("SET pg_trgm.similarity_threshold = 0.3;")
+                    cur = await conn.execute(
+                        f"""
+                        SELECT {COMPANY_JSON_SQL} AS company,
+                            company_number,
+                            count(*) OVER () AS total
+                        FROM companies
+                        WHERE company_name %% %s
+                        """
+                        + status_clause
+                        + """
+                        ORDER BY similarity(company_name, %s) DESC, company_number DESC
+                        LIMIT %s
+                        """,
+                        (query,) + status_params + (query, per_page),
+                    )
+                    companies = await cur.fetchall()
+                elif len(companies) == per_page:
+                    # Cursor for the next page, if this one was full
+                    next_rank = companies[-1]["rank"]
+                    next_number = companies[-1]["company_number"]
+
+                if not use_exact_total:
+                    # Planner estimate off the GIN statistics; page 1
+                    # already reported the exact figure to this client
+                    cur = await conn.execute(
+                        "EXPLAIN (FORMAT JSON) SELECT 1 FROM companies "
+                        "WHERE search_vector @@ plainto_tsquery('english', %s)"
+                        + status_clause,
+                        (query,) + status_params,
+                    )
+                    plan = (await cur.fetchone())["QUERY PLAN"]
+                    approx_total = int(plan[0]["Plan"]["Plan Rows"])
+
+            if approx_total is not None:
+                total = approx_total
+            else:
+                total = companies[0]["total"] if companies else 0
+
+        payload = build_search_payload(
+            companies, total, page, per_page, next_rank, next_number
         )
-        total = cur.fetchone()["total"]
 
-        # Get paginated results
-        cur.execute(
-            """
-            SELECT company_number, company_name, 
-                reg_address_care_of, reg_address_po_box, reg_address_line_1, reg_address_line_2,
-                reg_address_town, reg_address_county, reg_address_country, reg_address_postcode,
-                company_category, company_status, country_of_origin, 
-                incorporation_date, sic_codes
-            FROM companies 
-            WHERE search_vector @@ plainto_tsquery('english', %s)
-            ORDER BY ts_rank(search_vector, plainto_tsquery('english', %s)) DESC
-            LIMIT %s OFFSET %s
-            """,
-            (query, query, per_page, offset),
+        _local_cache_set(cache_key, payload)
+        await app.state.search_cache.set(cache_key, payload, ttl=SEARCH_CACHE_TTL)
+
+        return Response(
+            content=payload,
+            media_type="application/json",
+            headers={"ETag": cache_key},
         )
 
-        companies = cur.fetchall()
-
-        # Convert to list of Company objects
-        company_list = []
-        for row in companies:
-            # Create address object
-            address = Address(
-                care_of=row["reg_address_care_of"],
-                po_box=row["reg_address_po_box"],
-                address_line_1=row["reg_address_line_1"],
-                address_line_2=row["reg_address_line_2"],
-                town=row["reg_address_town"],
-                county=row["reg_address_county"],
-                country=row["reg_address_country"],
-                postcode=row["reg_address_postcode"],
-            )
-            
-            company = Company(
-                company_number=row["company_number"],
-                company_name=row["company_name"],
-                registered_office_address=address,
-                company_category=row["company_category"],
-                company_status=row["company_status"],
-                country_of_origin=row["country_of_origin"],
-                incorporation_date=(
-                    str(row["incorporation_date"])
-                    if row["incorporation_date"]
-                    else None
-                ),
-                sic_codes=row["sic_codes"],
+    except Exception as e:
+        logger.error(f"Search error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/search/batch")
+async def search_companies_batch(request: BatchSearchRequest):
+    """Resolve many search queries in a single round trip.
+
+    One statement fans the whole query list out through a LATERAL join,
+    so N debtor names cost one request lifecycle and one DB round trip
+    instead of N of each.
+    """
+    if not request.queries:
+        return {"results": []}
+    per_page = max(1, min(request.per_page, 100))
+    try:
+        async with app.state.pool.connection() as conn:
+            cur = await conn.execute(
+                f"""
+                SELECT q.ord, c.company
+                FROM unnest(%s::text[]) WITH ORDINALITY AS q(txt, ord)
+                CROSS JOIN LATERAL (
+                    SELECT {COMPANY_JSON_SQL} AS company
+                    FROM companies, plainto_tsquery('english', q.txt) AS tsq
+                    WHERE search_vector @@ tsq
+                    ORDER BY ts_rank(search_vector, tsq) DESC, company_number DESC
+                    LIMIT %s
+                ) c
+                """,
+                (request.queries, per_page),
             )
-            company_list.append(company)
+            rows = await cur.fetchall()
 
-        return {
-            "companies": company_list,
-            "total": total,
-            "page": page,
-            "per_page": per_page,
-        }
+        # Group per input query by ordinality; Fragment splices the
+        # DB-rendered JSON documents without reparsing them
+        results = [[] for _ in request.queries]
+        for row in rows:
+            results[row["ord"] - 1].append(orjson.Fragment(row["company"]))
+
+        return Response(
+            content=orjson.dumps({"results": results}),
+            media_type="application/json",
+        )
 
     except Exception as e:
-        logger.error(f"Search error: {e}")
+        logger.error(f"Batch search error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/company/{company_number}", response_model=Company)
+# No response_model: the row arrives from Postgres as a finished JSON
+# document, so revalidating it through Pydantic is duplicated work
+@app.get("/company/{company_number}")
 async def get_company_details(company_number: str):
     """Get detailed information for a specific company by number"""
     try:
-        conn = get_db_connection()
-        cur = conn.cursor()
-
-        cur.execute(
-            """
-            SELECT company_number, company_name, 
-                reg_address_care_of, reg_address_po_box, reg_address_line_1, reg_address_line_2,
-                reg_address_town, reg_address_county, reg_address_country, reg_address_postcode,
-                company_category, company_status, country_of_origin, 
-                incorporation_date, sic_codes
-            FROM companies 
-            WHERE company_number = %s
-            """,
-            (company_number,),
-        )
+        async with app.state.pool.connection() as conn:
+            cur = await conn.execute(
+                f"""
+                SELECT {COMPANY_JSON_SQL} AS company
+                FROM companies
+                WHERE company_number = %s
+                """,
+                (company_number,),
+            )
 
-        company = cur.fetchone()
+            company = await cur.fetchone()
 
         if not company:
             raise HTTPException(status_code=404, detail="Company not found")
 
-        # Create address object
-        address = Address(
-            care_of=company["reg_address_care_of"],
-            po_box=company["reg_address_po_box"],
-            address_line_1=company["reg_address_line_1"],
-            address_line_2=company["reg_address_line_2"],
-            town=company["reg_address_town"],
-            county=company["reg_address_county"],
-            country=company["reg_address_country"],
-            postcode=company["reg_address_postcode"],
-        )
-        
-        return Company(
-            company_number=company["company_number"],
-            company_name=company["company_name"],
-            registered_office_address=address,
-            company_category=company["company_category"],
-            company_status=company["company_status"],
-            country_of_origin=company["country_of_origin"],
-            incorporation_date=(
-                str(company["incorporation_date"])
-                if company["incorporation_date"]
-                else None
-            ),
-            sic_codes=company["sic_codes"],
+        return Response(
+            content=company["company"], media_type="application/json"
         )
 
     except HTTPException:
@@ -566,4 +1144,22 @@ async def get_company_details(company_number: str):
 
 
 if __name__ == "__main__":
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop and httptools replace the stdlib event loop and pure-Python
+    # HTTP parser with their C implementations; the per-request access log
+    # is disabled so logging doesn't add a synchronous stderr write.
+    # Workers default to 1: download_status, the ingest task handle and
+    # its lock are per-process, so with several workers /download/status
+    # polls hit workers that know nothing of the ingest and two POSTs to
+    # /download can start concurrent loads. Raise WEB_CONCURRENCY only
+    # once that state lives in a shared store (e.g. Redis) with a
+    # cross-process ingest lock.
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level="warning",
+        access_log=False,
+    )
\ No newline at end of file
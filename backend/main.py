@@ -1,8 +1,15 @@
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from matcher import CompanyNameMatcher
 
+# Shared session with keep-alive: one TCP connection serves the whole
+# debtor run instead of a fresh handshake per search/details call
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
 def load_debtors(csv_file):
     """Load debtor information from CSV file"""
     df = pd.read_csv(csv_file)
@@ -11,9 +18,10 @@ def load_debtors(csv_file):
 def search_companies(query):
     """Search for companies using FastAPI endpoint"""
     try:
-        response = requests.get(
+        response = _session.get(
             f"http://localhost:8000/search",
-            params={"query": query, "per_page": 10}
+            params={"query": query, "per_page": 10},
+            timeout=5
         )
         response.raise_for_status()
         return response.json()["companies"]
@@ -21,81 +29,115 @@ def search_companies(query):
         print(f"Error searching for {query}: {e}")
         return []
 
+def search_companies_batch(queries, batch_size=100):
+    """Resolve many search queries via the batch endpoint.
+
+    Returns a dict of query -> list of candidate companies. Queries are
+    sent in chunks so one request covers a whole chunk instead of one
+    HTTP round trip per debtor.
+    """
+    results = {}
+    for i in range(0, len(queries), batch_size):
+        chunk = list(queries[i:i + batch_size])
+        try:
+            response = _session.post(
+                "http://localhost:8000/search/batch",
+                json={"queries": chunk, "per_page": 10},
+                timeout=30
+            )
+            response.raise_for_status()
+            for query, companies in zip(chunk, response.json()["results"]):
+                results[query] = companies
+        except Exception as e:
+            print(f"Error batch searching: {e}")
+            for query in chunk:
+                results.setdefault(query, [])
+    return results
+
 def find_matches(debtors_df, confidence_threshold=0.95):
     """Find matches between debtor companies and Companies House data"""
     matcher = CompanyNameMatcher()
-    results = []
-    
+
     # Instead of filtering, we'll process all customer names
-    # and use the matcher's preprocessing to determine if it's likely a company
-    for idx, row in debtors_df.iterrows():
-        original_name = row["CustomerName"]
-        
-        # Skip empty names
-        if pd.isna(original_name) or not original_name.strip():
-            continue
-            
-        # Use matcher's preprocessing to normalize the name
-        normalized_name = matcher.normalize_company_name(original_name)
-        
-        # Skip if normalized name is empty (might indicate a personal name)
-        if not normalized_name.strip():
-            print(f"Skipping likely personal name: {original_name}")
-            continue
-            
+    # and use the matcher's preprocessing to determine if it's likely a company.
+    # The normalization pre-pass runs vectorized over the whole column up
+    # front, so the per-debtor loop below only does the HTTP + matching work
+    # and never constructs a Series per row the way iterrows does.
+    names = debtors_df["CustomerName"].dropna().str.strip()
+    names = names[names != ""]
+    normalized = names.map(matcher.normalize_company_name).str.strip()
+
+    # Empty normalized names likely indicate personal names
+    for original_name in names[normalized == ""]:
+        print(f"Skipping likely personal name: {original_name}")
+    keep = normalized != ""
+
+    kept_names = names[keep].to_numpy()
+    kept_norms = normalized[keep].to_numpy()
+    n = len(kept_names)
+
+    # One batched fan-out for every unique normalized name up front,
+    # instead of an HTTP call inside the matching loop; debtor files
+    # repeat the same company many times, and the result dict serves
+    # every duplicate from the single lookup
+    search_results = search_companies_batch(pd.unique(kept_norms))
+
+    # Preallocated result columns with known dtypes, filled by index and
+    # wrapped in a DataFrame once at the end, instead of appending a dict
+    # per debtor and letting pandas re-infer every column
+    best_match_names = np.empty(n, dtype=object)
+    best_match_numbers = np.empty(n, dtype=object)
+    confidences = np.zeros(n, dtype=np.float64)
+    all_details = np.empty(n, dtype=object)
+
+    for i in range(n):
+        original_name = kept_names[i]
+        normalized_name = kept_norms[i]
         print(f"Processing: {original_name} (normalized: {normalized_name})")
-        
-        # Search using normalised name
-        potential_matches = search_companies(normalized_name)
-                
+
+        potential_matches = search_results.get(normalized_name, [])
+
         if not potential_matches:
             print(f"No potential matches found for: {original_name}")
-            results.append({
-                "debtor_name": original_name,
-                "normalized_name": normalized_name,
-                "best_match_name": None,
-                "best_match_number": None,
-                "confidence": 0,
-                "high_confidence_match": False,
-                "match_details": None
-            })
+            best_match_names[i] = None
+            best_match_numbers[i] = None
+            all_details[i] = None
             continue
-        
+
         # Find the best match using the matcher
         reference_names = [company["company_name"] for company in potential_matches]
         best_match, confidence, match_details = matcher.find_best_match(
             original_name, reference_names, threshold=confidence_threshold
         )
-        
-        # Find corresponding company details
-        match_details_obj = None
-        match_number = None
-        
-        if best_match:
-            for company in potential_matches:
-                if company["company_name"] == best_match:
-                    match_details_obj = company
-                    match_number = company["company_number"]
-                    break
-        
-        results.append({
-            "debtor_name": original_name,
-            "normalized_name": normalized_name,
-            "best_match_name": best_match,
-            "best_match_number": match_number,
-            "confidence": confidence,
-            "high_confidence_match": confidence >= confidence_threshold,
-            "match_details": match_details
-        })
-        
+
+        # Resolve the matched company with one hash lookup rather than a
+        # linear scan over the candidate list
+        by_name = {c["company_name"]: c for c in potential_matches}
+        matched_company = by_name.get(best_match) if best_match else None
+
+        best_match_names[i] = best_match
+        best_match_numbers[i] = matched_company["company_number"] if matched_company else None
+        confidences[i] = confidence
+        all_details[i] = match_details
+
         print(f"Best match for '{original_name}': '{best_match}' with confidence {confidence:.2f}")
-    
-    return pd.DataFrame(results)
+
+    return pd.DataFrame({
+        "debtor_name": kept_names,
+        "normalized_name": kept_norms,
+        "best_match_name": best_match_names,
+        "best_match_number": best_match_numbers,
+        "confidence": confidences,
+        "high_confidence_match": confidences >= confidence_threshold,
+        "match_details": all_details,
+    })
 
 def get_company_details(company_number):
     """Get detailed information for a specific company by number"""
     try:
-        response = requests.get(f"http://localhost:8000/company/{company_number}")
+        response = _session.get(
+            f"http://localhost:8000/company/{company_number}", timeout=5
+        )
         response.raise_for_status()
         return response.json()
     except Exception as e:
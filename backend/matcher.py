@@ -1,130 +1,199 @@
+import functools
+from collections import Counter
 import pandas as pd
 import numpy as np
 import re
 import string
-from fuzzywuzzy import fuzz, process
+# RapidFuzz implements the fuzzywuzzy API on a bit-parallel C++ core;
+# these per-pair ratios are the hottest cost in batch matching
+from rapidfuzz import fuzz, process
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import spacy
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 
-# Download necessary NLTK resources
-nltk.download('punkt')
-nltk.download('stopwords')
-
-# Load English language model for spaCy
+# Download necessary NLTK resources, but only when not already on
+# disk: nltk.download otherwise re-checks the network index on every
+# process start
 try:
-    nlp = spacy.load("en_core_web_md")
-except:
-    # If model not installed, download it
-    import subprocess
-    subprocess.call([f"python -m spacy download en_core_web_md"], shell=True)
-    nlp = spacy.load("en_core_web_md")
+    nltk.data.find('corpora/stopwords')
+except LookupError:
+    nltk.download('stopwords')
+
+# The spaCy model loads lazily on first use, keeping it (and the
+# download fallback) off the import path: importing the matcher is
+# cheap per worker, and the model only loads in processes that score
+_nlp = None
+
+
+def _get_nlp():
+    """Load the English spaCy model once, on first use"""
+    global _nlp
+    if _nlp is None:
+        try:
+            _nlp = spacy.load("en_core_web_md")
+        except OSError:
+            # If model not installed, download it
+            import subprocess
+            subprocess.call(["python -m spacy download en_core_web_md"], shell=True)
+            _nlp = spacy.load("en_core_web_md")
+    return _nlp
+
+# Fixed metric order shared by the score vector and the weight vector;
+# the ensemble is a single dot product over this layout
+SCORE_KEYS = (
+    'exact_match', 'core_match', 'token_overlap', 'fuzzy_ratio',
+    'partial_ratio', 'token_sort_ratio', 'token_set_ratio',
+    'embedding_similarity',
+)
+SCORE_WEIGHTS = np.array([0.15, 0.15, 0.15, 0.1, 0.1, 0.15, 0.1, 0.1])
+
 
 class CompanyNameMatcher:
+    # Everything below is immutable shared vocabulary: built once at
+    # class definition and shared by every instance, so constructing a
+    # matcher no longer recompiles regexes or rebuilds word sets
+    stop_words = frozenset(stopwords.words('english'))
+
+    company_suffixes = {
+        'ltd': 'limited',
+        'inc': 'incorporated',
+        'llc': 'limited liability company',
+        'llp': 'limited liability partnership',
+        'corp': 'corporation',
+        'co': 'company',
+        'gmbh': 'gesellschaft mit beschränkter haftung',
+        'ag': 'aktiengesellschaft',
+        'sa': 'société anonyme',
+        'nv': 'naamloze vennootschap',
+        'bv': 'besloten vennootschap',
+        'plc': 'public limited company',
+        'lp': 'limited partnership',
+        'pllc': 'professional limited liability company',
+        'pty': 'proprietary',
+        'pvt': 'private',
+    }
+
+    # Legal entity type patterns for removal
+    entity_patterns = [
+        r'\b(?:limited|ltd|inc|incorporated|llc|llp|corp|corporation|co|company|'
+        r'gmbh|ag|sa|nv|bv|plc|lp|pllc|pty|pvt)\b',
+        r'\bl\.?l\.?c\.?\b',
+        r'\bl\.?l\.?p\.?\b',
+        r'\bp\.?l\.?c\.?\b',
+        r'\bp\.?t\.?y\.?\b',
+        r'\bp\.?v\.?t\.?\b',
+        r'\bi\.?n\.?c\.?\b',
+        r'\bl\.?t\.?d\.?\b',
+        r'\bc\.?o\.?\b',
+        r'\bc\.?o\.?r\.?p\.?\b',
+    ]
+
+    # Precompiled alternation over all entity patterns: one pass per
+    # name instead of looping re.sub (and recompiling) per pattern
+    entity_re = re.compile('|'.join(entity_patterns), flags=re.IGNORECASE)
+    whitespace_re = re.compile(r'\s+')
+
+    # Translation table mapping stripped punctuation to spaces (and
+    # ampersand to ' and '): one C-level pass over the name instead
+    # of a Python replace call per character
+    punct_table = str.maketrans(
+        {c: ' ' for c in "'\"!@#$%^&*()_+={}[]|\\:;<>,.?/~`"} | {'&': ' and '}
+    )
+
+    # Common words in company names that don't add much meaning
+    common_words = frozenset({
+        'group', 'holdings', 'international', 'global', 'world', 'worldwide',
+        'solutions', 'services', 'technologies', 'systems', 'industries', 'products',
+        'enterprises', 'ventures', 'partners', 'consulting', 'investment', 'investments',
+        'management', 'financial', 'capital', 'bank', 'trust', 'trading', 'media',
+        'communications', 'technology', 'tech', 'software', 'networks', 'network',
+        'pharmaceuticals', 'pharma', 'healthcare', 'medical', 'research', 'development',
+        'energy', 'resources', 'property', 'properties', 'real estate', 'construction'
+    })
+
+    # Precompiled trailing-common-word stripper: one pass removes any
+    # run of trailing common words, replacing the per-word re.sub loop
+    common_tail_re = re.compile(
+        r'(?:\s+(?:' + '|'.join(re.escape(w) for w in sorted(common_words)) + r'))+$',
+        flags=re.IGNORECASE,
+    )
+
+    # Merged filter set for core-name extraction: one membership
+    # test per token instead of two, and no per-token lower() since
+    # normalization already lowercases
+    drop_words = frozenset(stop_words | common_words)
+
+    # Abbreviation mappings
+    abbreviation_map = {
+        'intl': 'international',
+        'int': 'international',
+        'natl': 'national',
+        'nat': 'national',
+        'grp': 'group',
+        'tech': 'technology',
+        'techs': 'technologies',
+        'sys': 'systems',
+        'svcs': 'services',
+        'svc': 'service',
+        'sol': 'solutions',
+        'assoc': 'associates',
+        'assn': 'association',
+        'bros': 'brothers',
+        'ctr': 'center',
+        'cntl': 'control',
+        'comm': 'communications',
+        'mgmt': 'management',
+        'mfg': 'manufacturing',
+        'eng': 'engineering',
+        'equip': 'equipment',
+        'elec': 'electric',
+        'envir': 'environmental',
+        'dev': 'development',
+        'dist': 'distributing',
+        'distr': 'distribution',
+        'ent': 'enterprises',
+        'govt': 'government',
+        'hosp': 'hospital',
+        'inst': 'institute',
+        'labs': 'laboratories',
+        'maint': 'maintenance',
+        'mtc': 'maintenance',
+        'med': 'medical',
+        'petro': 'petroleum',
+        'prod': 'products',
+        'pub': 'publishing',
+        'transp': 'transportation',
+        'univ': 'university',
+        'util': 'utility',
+        'utils': 'utilities'
+    }
+
+    # Countries and locations for contextual matching
+    countries = {
+        'us': 'united states', 'usa': 'united states', 'uk': 'united kingdom',
+        'gb': 'great britain', 'uae': 'united arab emirates'
+    }
+
     def __init__(self):
-        """Initialize the company name matcher with required resources"""
-        self.stop_words = set(stopwords.words('english'))
-        self.company_suffixes = {
-            'ltd': 'limited',
-            'inc': 'incorporated',
-            'llc': 'limited liability company',
-            'llp': 'limited liability partnership',
-            'corp': 'corporation',
-            'co': 'company',
-            'gmbh': 'gesellschaft mit beschränkter haftung',
-            'ag': 'aktiengesellschaft',
-            'sa': 'société anonyme',
-            'nv': 'naamloze vennootschap',
-            'bv': 'besloten vennootschap',
-            'plc': 'public limited company',
-            'lp': 'limited partnership',
-            'pllc': 'professional limited liability company',
-            'pty': 'proprietary',
-            'pvt': 'private',
-        }
-        
-        # Legal entity type patterns for removal
-        self.entity_patterns = [
-            r'\b(?:limited|ltd|inc|incorporated|llc|llp|corp|corporation|co|company|'
-            r'gmbh|ag|sa|nv|bv|plc|lp|pllc|pty|pvt)\b',
-            r'\bl\.?l\.?c\.?\b',
-            r'\bl\.?l\.?p\.?\b',
-            r'\bp\.?l\.?c\.?\b',
-            r'\bp\.?t\.?y\.?\b',
-            r'\bp\.?v\.?t\.?\b',
-            r'\bi\.?n\.?c\.?\b',
-            r'\bl\.?t\.?d\.?\b',
-            r'\bc\.?o\.?\b',
-            r'\bc\.?o\.?r\.?p\.?\b',
-        ]
-        
-        # Common words in company names that don't add much meaning
-        self.common_words = {
-            'group', 'holdings', 'international', 'global', 'world', 'worldwide', 
-            'solutions', 'services', 'technologies', 'systems', 'industries', 'products',
-            'enterprises', 'ventures', 'partners', 'consulting', 'investment', 'investments',
-            'management', 'financial', 'capital', 'bank', 'trust', 'trading', 'media',
-            'communications', 'technology', 'tech', 'software', 'networks', 'network',
-            'pharmaceuticals', 'pharma', 'healthcare', 'medical', 'research', 'development',
-            'energy', 'resources', 'property', 'properties', 'real estate', 'construction'
-        }
-        
-        # Abbreviation mappings
-        self.abbreviation_map = {
-            'intl': 'international',
-            'int': 'international',
-            'natl': 'national',
-            'nat': 'national',
-            'grp': 'group',
-            'tech': 'technology',
-            'techs': 'technologies',
-            'sys': 'systems',
-            'svcs': 'services',
-            'svc': 'service',
-            'sol': 'solutions',
-            'assoc': 'associates',
-            'assn': 'association',
-            'bros': 'brothers',
-            'ctr': 'center',
-            'cntl': 'control',
-            'comm': 'communications',
-            'comm': 'community',
-            'mgmt': 'management',
-            'mfg': 'manufacturing',
-            'eng': 'engineering',
-            'equip': 'equipment',
-            'elec': 'electric',
-            'elec': 'electronic',
-            'envir': 'environmental',
-            'dev': 'development',
-            'dist': 'distributing',
-            'distr': 'distribution',
-            'ent': 'enterprises',
-            'govt': 'government',
-            'hosp': 'hospital',
-            'inst': 'institute',
-            'labs': 'laboratories',
-            'maint': 'maintenance',
-            'mtc': 'maintenance',
-            'med': 'medical',
-            'petro': 'petroleum',
-            'prod': 'products',
-            'pub': 'publishing',
-            'transp': 'transportation',
-            'univ': 'university',
-            'util': 'utility',
-            'utils': 'utilities'
-        }
-        
-        # Countries and locations for contextual matching
-        self.countries = {
-            'us': 'united states', 'usa': 'united states', 'uk': 'united kingdom', 
-            'gb': 'great britain', 'uae': 'united arab emirates'
-        }
+        """Initialize the per-instance caches; the shared vocabulary and
+        compiled patterns above live on the class"""
+        # Cache of name -> spaCy-derived tokens; see tokenize_company_name
+        self._token_cache = {}
 
+        # Cache of name -> unit mean word vector (None when vectorless)
+        self._vector_cache = {}
+
+        # Shared token vocabulary (token -> bit position) and cache of
+        # name -> token bitmask; see _token_mask
+        self._vocab_ids = {}
+        self._mask_cache = {}
+
+    # The same reference names are re-processed for every query, so the
+    # whole preprocessing chain is memoized per input string: the second
+    # and later sightings of a name cost one cache hit
+    @functools.lru_cache(maxsize=None)
     def preprocess_company_name(self, name):
         """
         Preprocess a company name by:
@@ -137,19 +206,17 @@ class CompanyNameMatcher:
         
         # Convert to lowercase
         name = name.lower()
-        
-        # Remove certain punctuation but keep some meaningful ones
-        for char in "'\"!@#$%^&*()_+={}[]|\\:;<>,.?/~`":
-            name = name.replace(char, ' ')
-        
-        # Replace ampersand with 'and'
-        name = name.replace('&', ' and ')
-        
+
+        # Remove certain punctuation (keeping some meaningful ones) and
+        # expand '&' to 'and', all in a single translate pass
+        name = name.translate(self.punct_table)
+
         # Normalize whitespaces
         name = ' '.join(name.split())
         
         return name
         
+    @functools.lru_cache(maxsize=None)
     def normalize_company_name(self, name):
         """
         Normalize a company name by:
@@ -181,35 +248,34 @@ class CompanyNameMatcher:
         # Join tokens back into a string
         normalized_name = ' '.join(normalized_tokens)
         
-        # Remove legal entity types
-        for pattern in self.entity_patterns:
-            normalized_name = re.sub(pattern, '', normalized_name, flags=re.IGNORECASE)
+        # Remove legal entity types in a single precompiled pass
+        normalized_name = self.entity_re.sub('', normalized_name)
         
         # Remove common words at the end of company names if they're standalone
-        for common_word in self.common_words:
-            pattern = r'\s+' + re.escape(common_word) + r'$'
-            normalized_name = re.sub(pattern, '', normalized_name, flags=re.IGNORECASE)
-            
+        normalized_name = self.common_tail_re.sub('', normalized_name)
+
         # Standardize common terms
         normalized_name = normalized_name.replace('and co', '')
         normalized_name = normalized_name.replace('& co', '')
         
         # Final cleanup of extra spaces
-        normalized_name = re.sub(r'\s+', ' ', normalized_name).strip()
+        normalized_name = self.whitespace_re.sub(' ', normalized_name).strip()
         
         return normalized_name
     
+    @functools.lru_cache(maxsize=None)
     def extract_core_name(self, name):
         """Extract the core name by removing common words and entity types"""
         normalized = self.normalize_company_name(name)
         
-        # Remove stopwords
-        tokens = word_tokenize(normalized)
-        filtered_tokens = [w for w in tokens if w.lower() not in self.stop_words]
-        
-        # Remove common words in company names
-        filtered_tokens = [w for w in filtered_tokens if w.lower() not in self.common_words]
-        
+        # Normalization already lowercased, stripped punctuation and
+        # collapsed whitespace, so a plain split yields the same tokens
+        # as treebank tokenization did
+        tokens = normalized.split()
+
+        # Remove stopwords and common company-name words in one pass
+        filtered_tokens = [w for w in tokens if w not in self.drop_words]
+
         # Join back
         core_name = ' '.join(filtered_tokens)
         
@@ -219,20 +285,97 @@ class CompanyNameMatcher:
         """Tokenize and normalize a company name using NLP"""
         if not name:
             return []
-            
-        # Process with spaCy for advanced entity recognition
-        doc = nlp(name)
-        
+
+        # Dict cache (rather than lru_cache) so batch paths can prime it
+        cached = self._token_cache.get(name)
+        if cached is not None:
+            return cached
+
+        # Process with spaCy; parser and NER are skipped since only
+        # stop/punct flags and lemmas are read below
+        doc = _get_nlp()(name, disable=['parser', 'ner'])
+
         # Extract meaningful tokens
         tokens = []
         for token in doc:
             if not token.is_stop and not token.is_punct and token.text.strip():
                 # Lemmatize and add to tokens
                 tokens.append(token.lemma_.lower())
-                
+
+        self._token_cache[name] = tokens
         return tokens
-    
-    def calculate_similarity_scores(self, name1, name2):
+
+    def _prime_token_cache(self, names):
+        """Tokenize many names in one nlp.pipe pass.
+
+        nlp.pipe batches documents through the pipeline, which is far
+        faster than calling nlp per name; after priming, per-pair
+        tokenize_company_name calls are plain dict lookups.
+        """
+        pending = [
+            n for n in dict.fromkeys(names) if n and n not in self._token_cache
+        ]
+        if not pending:
+            return
+        docs = _get_nlp().pipe(pending, batch_size=1024, disable=['parser', 'ner'])
+        for name, doc in zip(pending, docs):
+            self._token_cache[name] = [
+                token.lemma_.lower()
+                for token in doc
+                if not token.is_stop and not token.is_punct and token.text.strip()
+            ]
+
+    def _token_mask(self, name):
+        """Token set of a name packed into an integer bitmask.
+
+        Each distinct token across all names gets one bit in a shared
+        growing vocabulary, so the overlap ratio below is a bitwise AND
+        and two popcounts instead of building and intersecting Python
+        sets per pair.
+        """
+        mask = self._mask_cache.get(name)
+        if mask is not None:
+            return mask
+
+        mask = 0
+        vocab = self._vocab_ids
+        for token in self.tokenize_company_name(name):
+            bit = vocab.get(token)
+            if bit is None:
+                bit = len(vocab)
+                vocab[token] = bit
+            mask |= 1 << bit
+
+        self._mask_cache[name] = mask
+        return mask
+
+    @staticmethod
+    def _ngrams(name, n=3):
+        """Character n-grams of a normalized name, as a set"""
+        if len(name) < n:
+            return {name} if name else set()
+        return {name[k:k + n] for k in range(len(name) - n + 1)}
+
+    def _name_vector(self, name):
+        """Unit mean word vector for a name, cached per unique string.
+
+        nlp.make_doc only tokenizes; the word vectors come from the
+        model's vocab, which is all doc.similarity ever used, so the
+        full tagging/parsing pipeline never needs to run. Cached as
+        float16 — half the memory traffic, and for cosine of unit
+        vectors the precision loss is far below score granularity.
+        Returns None for names with no vector mass.
+        """
+        if name in self._vector_cache:
+            return self._vector_cache[name]
+
+        vector = _get_nlp().make_doc(name).vector
+        norm = np.linalg.norm(vector)
+        unit = (vector / norm).astype(np.float16) if norm else None
+        self._vector_cache[name] = unit
+        return unit
+
+    def calculate_similarity_scores(self, name1, name2, threshold=None):
         """
         Calculate multiple similarity scores between two company names:
         1. Exact match (after normalization)
@@ -241,6 +384,10 @@ class CompanyNameMatcher:
         4. Partial token ratio
         5. TF-IDF cosine similarity
         6. Word embedding similarity
+
+        Metrics are computed cheapest first; when a threshold is given
+        and even a perfect embedding score could not lift the weighted
+        ensemble to it, the embedding lookup is skipped and left at 0.0.
         """
         # Step 1: Normalize both names
         norm_name1 = self.normalize_company_name(name1)
@@ -250,10 +397,10 @@ class CompanyNameMatcher:
         core_name1 = self.extract_core_name(name1)
         core_name2 = self.extract_core_name(name2)
         
-        # Step 3: Tokenize names
-        tokens1 = set(self.tokenize_company_name(norm_name1))
-        tokens2 = set(self.tokenize_company_name(norm_name2))
-        
+        # Step 3: Tokenize names, as cached bitmasks
+        mask1 = self._token_mask(norm_name1)
+        mask2 = self._token_mask(norm_name2)
+
         scores = {}
         
         # Exact match after normalization
@@ -262,9 +409,11 @@ class CompanyNameMatcher:
         # Core name exact match
         scores['core_match'] = 1.0 if core_name1 == core_name2 and core_name1 != "" else 0.0
         
-        # Token overlap ratio
-        if tokens1 and tokens2:
-            scores['token_overlap'] = len(tokens1.intersection(tokens2)) / max(len(tokens1), len(tokens2))
+        # Token overlap ratio via popcounts over the cached bitmasks
+        if mask1 and mask2:
+            scores['token_overlap'] = (mask1 & mask2).bit_count() / max(
+                mask1.bit_count(), mask2.bit_count()
+            )
         else:
             scores['token_overlap'] = 0.0
         
@@ -274,16 +423,33 @@ class CompanyNameMatcher:
         scores['token_sort_ratio'] = fuzz.token_sort_ratio(norm_name1, norm_name2) / 100.0
         scores['token_set_ratio'] = fuzz.token_set_ratio(norm_name1, norm_name2) / 100.0
         
-        # Word embedding similarity using spaCy
+        scores['embedding_similarity'] = 0.0
+
+        # Everything cheap is in hand; bound the best-possible ensemble
+        # before paying for the vector lookup. The confidence boosts in
+        # is_high_confidence_match depend only on the cheap metrics and
+        # cap below any sensible threshold miss, so this exit is safe.
+        if threshold is not None:
+            cheap_vector = np.fromiter(
+                (scores[k] for k in SCORE_KEYS[:-1]),
+                dtype=np.float64,
+                count=len(SCORE_KEYS) - 1,
+            )
+            upper_bound = float(cheap_vector @ SCORE_WEIGHTS[:-1]) + SCORE_WEIGHTS[-1]
+            if upper_bound < threshold:
+                return scores
+
+        # Word embedding similarity: cosine of cached unit vectors, so
+        # each unique name is vectorized once instead of spaCy-parsed
+        # per pair
         if norm_name1 and norm_name2:
-            doc1 = nlp(norm_name1)
-            doc2 = nlp(norm_name2)
-            if doc1.vector_norm and doc2.vector_norm:  # Check if vectors are valid
-                scores['embedding_similarity'] = doc1.similarity(doc2)
-            else:
-                scores['embedding_similarity'] = 0.0
-        else:
-            scores['embedding_similarity'] = 0.0
+            v1 = self._name_vector(norm_name1)
+            v2 = self._name_vector(norm_name2)
+            if v1 is not None and v2 is not None:
+                # float16 is for storage; accumulate the dot in float32
+                scores['embedding_similarity'] = float(
+                    np.dot(v1.astype(np.float32), v2.astype(np.float32))
+                )
         
         return scores
     
@@ -292,8 +458,9 @@ class CompanyNameMatcher:
         Determine if two company names match with high confidence (>95%)
         using a weighted ensemble of similarity measures
         """
-        # Calculate all similarity scores
-        scores = self.calculate_similarity_scores(name1, name2)
+        # Calculate all similarity scores (the threshold lets clear
+        # misses skip the embedding metric)
+        scores = self.calculate_similarity_scores(name1, name2, threshold)
         
         # Check for exact match scenarios (highest confidence)
         if scores['exact_match'] == 1.0:
@@ -302,19 +469,12 @@ class CompanyNameMatcher:
         if scores['core_match'] == 1.0 and scores['token_overlap'] > 0.8:
             return True, 0.98, scores
         
-        # Weighted ensemble score
-        weights = {
-            'exact_match': 0.15,
-            'core_match': 0.15,
-            'token_overlap': 0.15,
-            'fuzzy_ratio': 0.1,
-            'partial_ratio': 0.1,
-            'token_sort_ratio': 0.15,
-            'token_set_ratio': 0.1,
-            'embedding_similarity': 0.1
-        }
-        
-        weighted_score = sum(scores[k] * weights[k] for k in weights)
+        # Weighted ensemble score as a fixed-order dot product: no dict
+        # of weights rebuilt per pair, and the arithmetic runs in numpy
+        score_vector = np.fromiter(
+            (scores[k] for k in SCORE_KEYS), dtype=np.float64, count=len(SCORE_KEYS)
+        )
+        weighted_score = float(score_vector @ SCORE_WEIGHTS)
         
         # Additional logic for high confidence matching
         # If certain key metrics are very high but others are lower
@@ -352,28 +512,107 @@ class CompanyNameMatcher:
         Match a list of query names against a reference list
         Returns a DataFrame with matches and confidence scores
         """
-        results = []
-        
-        for query in query_names:
-            best_match, confidence, details = self.find_best_match(query, reference_names, threshold)
-            
-            result = {
-                'query_name': query,
-                'normalized_query': self.normalize_company_name(query),
-                'best_match': best_match,
-                'normalized_match': self.normalize_company_name(best_match) if best_match else None,
-                'confidence': confidence,
-                'is_high_confidence': confidence >= threshold
-            }
-            
-            # Add detailed similarity scores
+        # Score the whole N x M grid in one C++ pass: cdist releases the
+        # GIL and fans out across cores, so candidate selection costs no
+        # per-pair Python calls. The full ensemble (embeddings included)
+        # then runs only on each query's top candidates.
+        norm_queries = [self.normalize_company_name(q) for q in query_names]
+        norm_refs = [self.normalize_company_name(r) for r in reference_names]
+
+        # Lemma tokens for every unique normalized name up front, so the
+        # ensemble scoring below hits the token cache instead of running
+        # spaCy one document at a time
+        self._prime_token_cache(norm_queries + norm_refs)
+
+        # Char-ngram TF-IDF forms, fitted once; per-query cosine rows are
+        # sparse matmuls over just the blocked candidates below
+        try:
+            vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 5))
+            vectorizer.fit(norm_queries + norm_refs)
+            tfidf_queries = vectorizer.transform(norm_queries)
+            tfidf_refs = vectorizer.transform(norm_refs)
+        except ValueError:
+            # Degenerate input (e.g. every name normalized to nothing)
+            tfidf_queries = tfidf_refs = None
+
+        # Blocking index: char-3-gram -> reference ids. Only references
+        # sharing at least one gram with the query are scored at all, so
+        # per-query work is bounded by the candidate block, not by M
+        ngram_index = {}
+        for j, ref in enumerate(norm_refs):
+            for gram in self._ngrams(ref):
+                ngram_index.setdefault(gram, []).append(j)
+
+        block_size = 50
+        top_k = 10
+
+        # Preallocated result columns with known dtypes, filled by index
+        # and wrapped in a DataFrame once at the end, instead of
+        # appending a dict per query and letting pandas re-infer every
+        # column from a list of rows
+        n = len(query_names)
+        best_matches = np.empty(n, dtype=object)
+        normalized_matches = np.empty(n, dtype=object)
+        confidences = np.zeros(n, dtype=np.float64)
+        score_columns = {
+            key: np.full(n, np.nan, dtype=np.float64) for key in SCORE_KEYS
+        }
+
+        for i, query in enumerate(query_names):
+            # Union the posting lists and rank references by shared-gram
+            # count; the best blocks go on to cheap pairwise scoring
+            overlap = Counter()
+            for gram in self._ngrams(norm_queries[i]):
+                for j in ngram_index.get(gram, ()):
+                    overlap[j] += 1
+            block = [j for j, _ in overlap.most_common(block_size)]
+
+            if block:
+                fuzz_scores = process.cdist(
+                    [norm_queries[i]],
+                    [norm_refs[j] for j in block],
+                    scorer=fuzz.token_set_ratio,
+                    workers=-1,
+                )[0] / 100.0
+                if tfidf_queries is not None:
+                    tfidf_scores = (
+                        tfidf_queries[i] @ tfidf_refs[block].T
+                    ).toarray()[0]
+                    fuzz_scores = np.maximum(fuzz_scores, tfidf_scores)
+                order = np.argsort(fuzz_scores)[::-1][:top_k]
+                candidates = [reference_names[block[k]] for k in order]
+                # Normalized forms were computed up front; carry them to
+                # the result row rather than re-deriving them per match
+                candidate_norms = {
+                    reference_names[block[k]]: norm_refs[block[k]] for k in order
+                }
+            else:
+                candidates = []
+                candidate_norms = {}
+
+            best_match, confidence, details = self.find_best_match(query, candidates, threshold)
+
+            best_matches[i] = best_match
+            normalized_matches[i] = candidate_norms.get(best_match)
+            confidences[i] = confidence
+
+            # Detailed similarity scores (NaN where nothing was scored)
             if details:
                 for score_type, score in details.items():
-                    result[f'score_{score_type}'] = score
-                    
-            results.append(result)
-            
-        return pd.DataFrame(results)
+                    score_columns[score_type][i] = score
+
+        frame = {
+            'query_name': np.asarray(query_names, dtype=object),
+            'normalized_query': np.asarray(norm_queries, dtype=object),
+            'best_match': best_matches,
+            'normalized_match': normalized_matches,
+            'confidence': confidences,
+            'is_high_confidence': confidences >= threshold,
+        }
+        for score_type, column in score_columns.items():
+            frame[f'score_{score_type}'] = column
+
+        return pd.DataFrame(frame)
 
 
 # Example usage
@@ -13,7 +13,11 @@ $$;
 -- Connect to the database
 \c companies_db
 
--- Create the companies table with expanded address fields
+-- Create the companies table with expanded address fields.
+-- search_vector and the address snippet are stored generated columns,
+-- computed by the executor during INSERT/COPY instead of a per-row
+-- PL/pgSQL trigger; this must stay in line with init_db() in
+-- backend/app.py, which migrates older trigger-based schemas.
 CREATE TABLE IF NOT EXISTS companies (
     id SERIAL PRIMARY KEY,
     company_number VARCHAR(10) UNIQUE,
@@ -31,46 +35,50 @@ CREATE TABLE IF NOT EXISTS companies (
     country_of_origin VARCHAR(50),
     incorporation_date DATE,
     sic_codes TEXT,
-    search_vector TSVECTOR
+    registered_office_address_text TEXT GENERATED ALWAYS AS (
+        array_to_string(ARRAY[
+            NULLIF(reg_address_care_of, ''),
+            NULLIF(reg_address_po_box, ''),
+            NULLIF(reg_address_line_1, ''),
+            NULLIF(reg_address_line_2, ''),
+            NULLIF(reg_address_town, ''),
+            NULLIF(reg_address_county, ''),
+            NULLIF(reg_address_country, ''),
+            NULLIF(reg_address_postcode, '')
+        ], ', ')
+    ) STORED,
+    search_vector TSVECTOR GENERATED ALWAYS AS (to_tsvector('english',
+        COALESCE(company_name, '') || ' ' ||
+        COALESCE(company_number, '') || ' ' ||
+        COALESCE(reg_address_care_of, '') || ' ' ||
+        COALESCE(reg_address_po_box, '') || ' ' ||
+        COALESCE(reg_address_line_1, '') || ' ' ||
+        COALESCE(reg_address_line_2, '') || ' ' ||
+        COALESCE(reg_address_town, '') || ' ' ||
+        COALESCE(reg_address_county, '') || ' ' ||
+        COALESCE(reg_address_country, '') || ' ' ||
+        COALESCE(reg_address_postcode, '') || ' ' ||
+        COALESCE(company_category, '') || ' ' ||
+        COALESCE(company_status, '') || ' ' ||
+        COALESCE(country_of_origin, '') || ' ' ||
+        COALESCE(sic_codes, '')
+    )) STORED
 );
 
--- Create an index for the full-text search
-CREATE INDEX IF NOT EXISTS idx_companies_search_vector ON companies USING GIN(search_vector);
+-- Store the wide tsvector out of line and uncompressed; ranked queries
+-- detoast it per row
+ALTER TABLE companies ALTER COLUMN search_vector SET STORAGE EXTERNAL;
 
--- Create a function to update the search vector, including all address fields
-CREATE OR REPLACE FUNCTION companies_search_vector_update() RETURNS TRIGGER AS $$
-BEGIN
-    NEW.search_vector = to_tsvector('english', 
-        COALESCE(NEW.company_name, '') || ' ' || 
-        COALESCE(NEW.company_number, '') || ' ' || 
-        COALESCE(NEW.reg_address_care_of, '') || ' ' ||
-        COALESCE(NEW.reg_address_po_box, '') || ' ' ||
-        COALESCE(NEW.reg_address_line_1, '') || ' ' ||
-        COALESCE(NEW.reg_address_line_2, '') || ' ' ||
-        COALESCE(NEW.reg_address_town, '') || ' ' ||
-        COALESCE(NEW.reg_address_county, '') || ' ' ||
-        COALESCE(NEW.reg_address_country, '') || ' ' ||
-        COALESCE(NEW.reg_address_postcode, '') || ' ' ||
-        COALESCE(NEW.company_category, '') || ' ' || 
-        COALESCE(NEW.company_status, '') || ' ' || 
-        COALESCE(NEW.country_of_origin, '') || ' ' || 
-        COALESCE(NEW.sic_codes, '')
-    );
-    RETURN NEW;
-END
-$$ LANGUAGE plpgsql;
-
--- Drop the trigger if it exists
-DROP TRIGGER IF EXISTS companies_search_vector_update_trigger ON companies;
-
--- Create the trigger
-CREATE TRIGGER companies_search_vector_update_trigger
-BEFORE INSERT OR UPDATE ON companies
-FOR EACH ROW EXECUTE FUNCTION companies_search_vector_update();
+-- Create an index for the full-text search; fastupdate off because the
+-- table only changes via the bulk reload path
+CREATE INDEX IF NOT EXISTS idx_companies_search_vector ON companies USING GIN(search_vector) WITH (fastupdate = off);
 
--- Create an index on company_number for faster lookups
-CREATE INDEX IF NOT EXISTS idx_company_number ON companies(company_number);
+-- Status index so searches scoped to e.g. active companies can
+-- bitmap-AND away the dissolved majority
+CREATE INDEX IF NOT EXISTS idx_companies_status ON companies (company_status);
 
--- Create indexes on commonly searched address fields
-CREATE INDEX IF NOT EXISTS idx_reg_address_postcode ON companies(reg_address_postcode);
-CREATE INDEX IF NOT EXISTS idx_reg_address_town ON companies(reg_address_town);
\ No newline at end of file
+-- Trigram index for short/prefix queries that tokenize to an empty
+-- tsquery; company_number lookups use the btree created by the UNIQUE
+-- constraint
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_companies_name_trgm ON companies USING GIN (company_name gin_trgm_ops) WITH (fastupdate = off);